@@ -4,7 +4,9 @@ The problem description for this problem is in prompt.md.
 To use, read through the problem description linked above - starting just with level 1.
 Not looking ahead most accurately simulates how things like CodeSignal progressively show you the problem.
 
-After implementing the first level, run `python bank_ledger/test.py --level 1` and progress through all levels to level 3.
+After implementing the first level, run `python bank_ledger/test.py --level 1` and progress through all levels to level 4.
+
+Once level 4 is passing, `python bank_ledger/bench.py` measures writer throughput with and without an open snapshot.
 
 See the main readme for disclaimers and other info.
 """
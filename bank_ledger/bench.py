@@ -0,0 +1,97 @@
+"""
+This is a benchmark for the level 4 snapshot reads of the BankLedger in bank_system.py.
+
+It measures writer throughput twice: once on its own, and once while a reporter thread
+holds a snapshot open and reads every balance in a loop.
+
+To run: `python bank_ledger/bench.py` (see `--help` for sizes).
+"""
+
+import argparse
+import random
+import threading
+import time
+from bank_system import BankLedger
+
+CURRENCIES = ["USD", "EUR"]
+
+
+def setup(num_accounts: int) -> BankLedger:
+    ledger = BankLedger()
+    for i in range(num_accounts):
+        ledger.open_account(f"acct{i}", CURRENCIES)
+        ledger.deposit(f"acct{i}", "USD", 1_000_000)
+    return ledger
+
+
+def run_writes(ledger: BankLedger, num_accounts: int, num_ops: int, seed: int) -> float:
+    """Runs a mix of deposits and transfers. Returns operations per second."""
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(num_ops):
+        a = f"acct{rng.randrange(num_accounts)}"
+        if rng.random() < 0.5:
+            ledger.deposit(a, "USD", rng.randint(1, 100))
+        else:
+            b = f"acct{rng.randrange(num_accounts)}"
+            ledger.transfer(a, b, "USD", rng.choice(CURRENCIES), rng.randint(1, 100))
+    return num_ops / (time.perf_counter() - start)
+
+
+def run_report(
+    ledger: BankLedger, num_accounts: int, stop: threading.Event, stats: dict
+):
+    """Reads every balance from a single snapshot until told to stop."""
+    snapshot_id = ledger.open_snapshot()
+    try:
+        while not stop.is_set():
+            total = 0
+            for i in range(num_accounts):
+                for currency in CURRENCIES:
+                    total += ledger.get_snapshot_balance(
+                        snapshot_id, f"acct{i}", currency
+                    )
+            stats["passes"] += 1
+            stats["totals"].add(total)
+    finally:
+        ledger.close_snapshot(snapshot_id)
+
+
+def bench(num_accounts: int, num_ops: int, seed: int):
+    ledger = setup(num_accounts)
+    baseline = run_writes(ledger, num_accounts, num_ops, seed)
+    print(f"\nWrites, no report:      {baseline:,.0f} ops/s")
+
+    ledger = setup(num_accounts)
+    stop = threading.Event()
+    stats = {"passes": 0, "totals": set()}
+    reporter = threading.Thread(
+        target=run_report, args=(ledger, num_accounts, stop, stats)
+    )
+    reporter.start()
+    with_report = run_writes(ledger, num_accounts, num_ops, seed)
+    stop.set()
+    reporter.join()
+    print(f"Writes, report running: {with_report:,.0f} ops/s")
+    print(f"Report passes:          {stats['passes']}")
+
+    # Every pass over the same snapshot has to add up to the same total
+    assert len(stats["totals"]) <= 1, (
+        f"❌ Snapshot was not consistent, saw totals {sorted(stats['totals'])}."
+    )
+    print(f"\n🥳 Snapshot stayed consistent ({with_report / baseline:.0%} of baseline)")
+
+
+if __name__ == "__main__":
+    print("🔄 Benchmarking bank ledger snapshots")
+    parser = argparse.ArgumentParser(
+        description="Compares BankLedger writer throughput with and without a long-running snapshot report."
+    )
+    parser.add_argument(
+        "--accounts", type=int, default=1_000, help="Number of accounts"
+    )
+    parser.add_argument("--ops", type=int, default=200_000, help="Number of writes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    bench(args.accounts, args.ops, args.seed)
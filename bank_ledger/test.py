@@ -1,7 +1,7 @@
 """
 This is a test harness for the problem for the BankLedger in bank_ledger.py.
 
-To run: `python bank_ledger/test.py --level {lvl}` where level goes up to 3.
+To run: `python bank_ledger/test.py --level {lvl}` where level goes up to 4.
 """
 
 import argparse
@@ -163,21 +163,72 @@ def test_level_3():
     test_exec("Level 3", tests)
 
 
+def test_level_4():
+    """Level 4: Snapshot Reads for Reporting"""
+
+    tests = [
+        {"fn": "open_account", "args": ["acct1", ["USD", "EUR"]], "expected": None},
+        {"fn": "open_account", "args": ["acct2", ["USD"]], "expected": None},
+        {"fn": "deposit", "args": ["acct1", "USD", 1000], "expected": True},
+        # Snapshot 1 freezes acct1 USD at 1000 and acct2 USD at 0
+        {"fn": "open_snapshot", "args": [], "expected": 1},
+        {"fn": "deposit", "args": ["acct1", "USD", 500], "expected": True},
+        {
+            "fn": "transfer",
+            "args": ["acct1", "acct2", "USD", "USD", 300],
+            "expected": True,
+        },
+        {"fn": "get_balance", "args": ["acct1", "USD"], "expected": 1200},
+        {"fn": "get_balance", "args": ["acct2", "USD"], "expected": 300},
+        {"fn": "get_snapshot_balance", "args": [1, "acct1", "USD"], "expected": 1000},
+        {"fn": "get_snapshot_balance", "args": [1, "acct2", "USD"], "expected": 0},
+        # Only the version seen by snapshot 1 and the latest version are kept
+        {"fn": "get_version_count", "args": ["acct1", "USD"], "expected": 2},
+        # Accounts opened after the snapshot are not visible to it
+        {"fn": "open_account", "args": ["acct3", ["USD"]], "expected": None},
+        {
+            "fn": "get_snapshot_balance",
+            "args": [1, "acct3", "USD"],
+            "expected": None,
+            "exception": True,
+        },
+        {"fn": "open_snapshot", "args": [], "expected": 2},
+        {"fn": "deposit", "args": ["acct1", "USD", 100], "expected": True},
+        {"fn": "get_snapshot_balance", "args": [2, "acct1", "USD"], "expected": 1200},
+        {"fn": "get_version_count", "args": ["acct1", "USD"], "expected": 3},
+        # Closing snapshot 1 lets its version be garbage collected
+        {"fn": "close_snapshot", "args": [1], "expected": True},
+        {"fn": "get_version_count", "args": ["acct1", "USD"], "expected": 2},
+        {
+            "fn": "get_snapshot_balance",
+            "args": [1, "acct1", "USD"],
+            "expected": None,
+            "exception": True,
+        },
+        {"fn": "close_snapshot", "args": [1], "expected": False},
+        {"fn": "close_snapshot", "args": [2], "expected": True},
+        {"fn": "get_version_count", "args": ["acct1", "USD"], "expected": 1},
+        {"fn": "get_balance", "args": ["acct1", "USD"], "expected": 1300},
+    ]
+
+    test_exec("Level 4", tests)
+
+
 if __name__ == "__main__":
     print("🔄 Running bank ledger")
     parser = argparse.ArgumentParser(
-        description="A coding practice problem simulating a bank ledger system, where it gets progressively more difficult through 3 levels."
+        description="A coding practice problem simulating a bank ledger system, where it gets progressively more difficult through 4 levels."
     )
 
     parser.add_argument(
         "--level",
         type=int,
-        default=3,
+        default=4,
         help="The number of levels to run (optional - defaults to all)",
     )
     args = parser.parse_args()
 
-    test_suites = [test_level_1, test_level_2, test_level_3]
+    test_suites = [test_level_1, test_level_2, test_level_3, test_level_4]
 
-    for i in range(min(3, args.level)):
+    for i in range(min(4, args.level)):
         test_suites[i]()
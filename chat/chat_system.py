@@ -5,6 +5,7 @@ To use, read through the problem description linked above - starting just with l
 Not looking ahead most accurately simulates how things like CodeSignal progressively show you the problem.
 
 After implementing the first level here, run `python chat/test.py --level 1` and progress through all levels to level 4.
+Level 5 (full-text search) is not part of the linked problem - it is described in `test_level_5` in chat/test.py.
 
 See the main readme for disclaimers and other info.
 """
@@ -122,21 +122,145 @@ def test_level_4():
     test_exec("Level 4", tests)
 
 
+def test_level_5():
+    """
+    Level 5 is not part of the original problem. Add full-text search over message bodies:
+
+    - search_messages(user_id, query) searches one user's messages.
+    - search_all_messages(query) searches every user's messages, ordered by user then message ID.
+    - search_messages_at(user_id, query, timestamp) respects expiry and deletion like get_message_at.
+    - search_all_messages_at(query, timestamp) does the same across every user.
+
+    search_messages and search_all_messages see the same messages as list_messages.
+
+    Bodies are split into lowercase alphanumeric tokens. Query terms are matched case-insensitively.
+    Every query term must match (AND).
+    A term ending in `*` matches any token with that prefix. Results use the list_messages format.
+
+    Don't scan every body per search: keep an inverted index from token to message IDs, with
+    compressed posting lists, and update it as messages are sent and deleted. Sending an existing
+    message ID again replaces its body, so its old tokens must stop matching.
+    """
+    tests = [
+        {
+            "fn": "send_message",
+            "args": ["Alice", "m1", "Meeting at 5 in the big room"],
+            "expected": "",
+        },
+        {
+            "fn": "send_message",
+            "args": ["Alice", "m2", "Big news: meeting moved"],
+            "expected": "",
+        },
+        {"fn": "send_message", "args": ["Alice", "m3", "Lunch?"], "expected": ""},
+        {
+            "fn": "send_message",
+            "args": ["Bob", "b1", "meeting notes attached"],
+            "expected": "",
+        },
+        {
+            "fn": "search_messages",
+            "args": ["Alice", "meeting"],
+            "expected": "m1(Meeting at 5 in the big room), m2(Big news: meeting moved)",
+        },
+        {
+            "fn": "search_messages",
+            "args": ["Alice", "room meeting"],
+            "expected": "m1(Meeting at 5 in the big room)",
+        },
+        {
+            "fn": "search_messages",
+            "args": ["Alice", "MEET*"],
+            "expected": "m1(Meeting at 5 in the big room), m2(Big news: meeting moved)",
+        },
+        {"fn": "search_messages", "args": ["Alice", "lunch"], "expected": "m3(Lunch?)"},
+        {"fn": "search_messages", "args": ["Alice", "lunch big"], "expected": ""},
+        # Re-sending m3 replaces its body in the index
+        {"fn": "send_message", "args": ["Alice", "m3", "Coffee later"], "expected": ""},
+        {"fn": "search_messages", "args": ["Alice", "lunch"], "expected": ""},
+        {
+            "fn": "search_messages",
+            "args": ["Alice", "coffee"],
+            "expected": "m3(Coffee later)",
+        },
+        {"fn": "search_messages", "args": ["Bob", "big"], "expected": ""},
+        {
+            "fn": "search_all_messages",
+            "args": ["meeting"],
+            "expected": "m1(Meeting at 5 in the big room), m2(Big news: meeting moved), b1(meeting notes attached)",
+        },
+        {"fn": "delete_message", "args": ["Alice", "m2"], "expected": True},
+        {
+            "fn": "search_all_messages",
+            "args": ["meeting"],
+            "expected": "m1(Meeting at 5 in the big room), b1(meeting notes attached)",
+        },
+        {
+            "fn": "send_message_with_expiry",
+            "args": ["Carol", "c1", "Standup in 5", 10, 20],
+            "expected": None,
+        },
+        {
+            "fn": "search_messages_at",
+            "args": ["Carol", "standup", 15],
+            "expected": "c1(Standup in 5)",
+        },
+        {
+            "fn": "send_message_at",
+            "args": ["Carol", "c2", "Standup done", 40],
+            "expected": None,
+        },
+        # c1 expired at 30
+        {
+            "fn": "search_messages_at",
+            "args": ["Carol", "standup", 45],
+            "expected": "c2(Standup done)",
+        },
+        {
+            "fn": "send_message_with_expiry",
+            "args": ["Dave", "d1", "Standup moved", 42, 10],
+            "expected": None,
+        },
+        {
+            "fn": "search_all_messages_at",
+            "args": ["standup", 45],
+            "expected": "c2(Standup done), d1(Standup moved)",
+        },
+        {"fn": "delete_message_at", "args": ["Carol", "c2", 50], "expected": True},
+        {
+            "fn": "search_all_messages_at",
+            "args": ["standup", 51],
+            "expected": "d1(Standup moved)",
+        },
+        # d1 expired at 52
+        {"fn": "search_all_messages_at", "args": ["stand*", 55], "expected": ""},
+        {"fn": "search_messages_at", "args": ["Carol", "stand*", 55], "expected": ""},
+    ]
+
+    test_exec("Level 5", tests)
+
+
 if __name__ == "__main__":
     print("🔄 Running chat")
     parser = argparse.ArgumentParser(
-        description="A coding practice problem simulating a chat messaging system, where it get progressively more difficult through 4 levels."
+        description="A coding practice problem simulating a chat messaging system, where it get progressively more difficult through 5 levels."
     )
 
     parser.add_argument(
         "--level",
         type=int,
-        default=4,
+        default=5,
         help="The number of levels to run (optional - defaults to all)",
     )
     args = parser.parse_args()
 
-    test_suites = [test_level_1, test_level_2, test_level_3, test_level_4]
+    test_suites = [
+        test_level_1,
+        test_level_2,
+        test_level_3,
+        test_level_4,
+        test_level_5,
+    ]
 
-    for i in range(min(4, args.level)):
+    for i in range(min(5, args.level)):
         test_suites[i]()
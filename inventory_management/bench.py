@@ -0,0 +1,76 @@
+"""
+This is a benchmark for the level 4 find_item cache of the InventorySystem in inventory_system.py.
+
+It runs a read-heavy mix: most operations are find_item calls drawn from a small set of hot queries,
+and the rest are add_item calls that each touch one section.
+The same workload runs once with the cache turned off (capacity 0) and once with the default capacity.
+
+To run: `python inventory_management/bench.py` (see `--help` for sizes).
+"""
+
+import argparse
+import random
+import time
+from inventory_system import InventorySystem
+
+
+def run(
+    cache_capacity: str,
+    sections: int,
+    items: int,
+    ops: int,
+    write_ratio: float,
+    seed: int,
+):
+    """Runs the workload with the given cache capacity. Returns operations per second."""
+    rng = random.Random(seed)
+    inventory = InventorySystem()
+    inventory.set_cache_capacity(cache_capacity)
+    for s in range(sections):
+        for i in range(items):
+            inventory.add_item(
+                f"/warehouse/section{s}/item{i}", str(rng.randint(1, 100))
+            )
+
+    hot_queries = [("/warehouse", "item")] + [
+        (f"/warehouse/section{s}", "item") for s in range(sections)
+    ]
+    next_item = items
+    start = time.perf_counter()
+    for _ in range(ops):
+        if rng.random() < write_ratio:
+            s = rng.randrange(sections)
+            inventory.add_item(f"/warehouse/section{s}/item{next_item}", "1")
+            next_item += 1
+        else:
+            inventory.find_item(*rng.choice(hot_queries))
+    throughput = ops / (time.perf_counter() - start)
+
+    print(f"Cache capacity {cache_capacity}:")
+    print(f"  Throughput: {throughput:,.0f} ops/s")
+    print(f"  Cache:      {inventory.get_cache_stats()}")
+    return throughput
+
+
+def bench(sections: int, items: int, ops: int, write_ratio: float, seed: int):
+    print(f"\n{ops:,} ops ({write_ratio:.0%} writes)")
+    uncached = run("0", sections, items, ops, write_ratio, seed)
+    cached = run("128", sections, items, ops, write_ratio, seed)
+    print(f"\n🥳 Cache gives {cached / uncached:.1f}x throughput")
+
+
+if __name__ == "__main__":
+    print("🔄 Benchmarking inventory find_item cache")
+    parser = argparse.ArgumentParser(
+        description="Benchmarks InventorySystem.find_item caching on a read-heavy mixed workload."
+    )
+    parser.add_argument("--sections", type=int, default=20, help="Number of sections")
+    parser.add_argument("--items", type=int, default=500, help="Items per section")
+    parser.add_argument("--ops", type=int, default=50_000, help="Number of operations")
+    parser.add_argument(
+        "--write-ratio", type=float, default=0.05, help="Fraction of writes"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    bench(args.sections, args.items, args.ops, args.write_ratio, args.seed)
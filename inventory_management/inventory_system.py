@@ -5,6 +5,8 @@ To use, read through the problem description linked above - starting just with l
 Not looking ahead most accurately simulates how things like CodeSignal progressively show you the problem.
 
 After implementing the first level here, run `python inventory_management/test.py --level 1` and progress through all levels to level 3.
+Level 4 (cached search) is not part of the linked problem - it is described in `test_level_4` in inventory_management/test.py,
+and `python inventory_management/bench.py` benchmarks it.
 
 See the main readme for disclaimers and other info.
 
@@ -1,7 +1,7 @@
 """
 This is a test harness for the problem for the InventorySystem in inventory_management.py.
 
-To run: `python inventory_management/test.py --level {lvl}` where level goes up to 3.
+To run: `python inventory_management/test.py --level {lvl}` where level goes up to 4.
 """
 
 import argparse
@@ -174,21 +174,159 @@ def test_level_3():
     test_exec("Level 3", tests)
 
 
+def test_level_4():
+    """
+    Level 4: Cached Item Search
+
+    Level 4 is not part of the original problem. Cache find_item results in a bounded LRU cache:
+
+    - The cache holds up to 128 queries by default.
+    - set_cache_capacity(capacity) sets the maximum number of cached queries (evicting least recently used ones) and returns True.
+      A capacity of "0" turns caching off.
+    - get_cache_stats() returns "hits: H, misses: M, invalidations: I".
+
+    A successful add_item, copy_item, add_item_by, or an update_capacity that deletes items only invalidates
+    cached queries whose prefix covers the changed path. Track this with a generation counter on each trie node
+    so a hot query is O(1). A cached query whose prefix has no items yet must still be invalidated when a
+    write later creates a path under that prefix. A lookup that finds a stale entry counts as a miss and an invalidation.
+    LRU evictions are not invalidations.
+    """
+
+    tests = [
+        {
+            "fn": "add_item",
+            "args": ["/warehouse/sectionA/item1", "10"],
+            "expected": True,
+        },
+        {
+            "fn": "add_item",
+            "args": ["/warehouse/sectionB/item2", "20"],
+            "expected": True,
+        },
+        {"fn": "add_item", "args": ["/office/item3", "5"], "expected": True},
+        {
+            "fn": "find_item",
+            "args": ["/warehouse", "item"],
+            "expected": "/warehouse/sectionB/item2 (20), /warehouse/sectionA/item1 (10)",
+        },
+        # Same query again is served from the cache
+        {
+            "fn": "find_item",
+            "args": ["/warehouse", "item"],
+            "expected": "/warehouse/sectionB/item2 (20), /warehouse/sectionA/item1 (10)",
+        },
+        {
+            "fn": "find_item",
+            "args": ["/office", "item"],
+            "expected": "/office/item3 (5)",
+        },
+        {
+            "fn": "get_cache_stats",
+            "args": [],
+            "expected": "hits: 1, misses: 2, invalidations: 0",
+        },
+        # Writing under /office leaves /warehouse cached
+        {"fn": "add_item", "args": ["/office/item4", "1"], "expected": True},
+        {
+            "fn": "find_item",
+            "args": ["/warehouse", "item"],
+            "expected": "/warehouse/sectionB/item2 (20), /warehouse/sectionA/item1 (10)",
+        },
+        {
+            "fn": "find_item",
+            "args": ["/office", "item"],
+            "expected": "/office/item3 (5), /office/item4 (1)",
+        },
+        {
+            "fn": "find_item",
+            "args": ["/warehouse/sectionB", "item"],
+            "expected": "/warehouse/sectionB/item2 (20)",
+        },
+        # Copying into sectionC invalidates /warehouse but not its sibling /warehouse/sectionB
+        {
+            "fn": "copy_item",
+            "args": ["/warehouse/sectionA/item1", "/warehouse/sectionC/item1"],
+            "expected": True,
+        },
+        {
+            "fn": "find_item",
+            "args": ["/warehouse/sectionB", "item"],
+            "expected": "/warehouse/sectionB/item2 (20)",
+        },
+        {
+            "fn": "find_item",
+            "args": ["/warehouse", "item"],
+            "expected": "/warehouse/sectionB/item2 (20), /warehouse/sectionA/item1 (10), /warehouse/sectionC/item1 (10)",
+        },
+        {
+            "fn": "get_cache_stats",
+            "args": [],
+            "expected": "hits: 3, misses: 5, invalidations: 2",
+        },
+        # Failed writes don't invalidate anything
+        {"fn": "add_item", "args": ["/office/item3", "9"], "expected": False},
+        {
+            "fn": "find_item",
+            "args": ["/office", "item"],
+            "expected": "/office/item3 (5), /office/item4 (1)",
+        },
+        # Shrinking the cache evicts the least recently used query (/warehouse/sectionB)
+        {"fn": "set_cache_capacity", "args": ["2"], "expected": True},
+        {
+            "fn": "find_item",
+            "args": ["/warehouse/sectionB", "item"],
+            "expected": "/warehouse/sectionB/item2 (20)",
+        },
+        {
+            "fn": "find_item",
+            "args": ["/office", "item"],
+            "expected": "/office/item3 (5), /office/item4 (1)",
+        },
+        # /warehouse was evicted to make room for /warehouse/sectionB
+        {
+            "fn": "find_item",
+            "args": ["/warehouse", "item"],
+            "expected": "/warehouse/sectionB/item2 (20), /warehouse/sectionA/item1 (10), /warehouse/sectionC/item1 (10)",
+        },
+        {
+            "fn": "get_cache_stats",
+            "args": [],
+            "expected": "hits: 5, misses: 7, invalidations: 2",
+        },
+        {"fn": "add_user", "args": ["user1", "100"], "expected": True},
+        # /lab has no items yet, but the empty result still has to be invalidated
+        {"fn": "find_item", "args": ["/lab", "item"], "expected": ""},
+        {"fn": "add_item_by", "args": ["user1", "/lab/itemA", "60"], "expected": "40"},
+        {"fn": "find_item", "args": ["/lab", "item"], "expected": "/lab/itemA (60)"},
+        {"fn": "find_item", "args": ["/lab", "item"], "expected": "/lab/itemA (60)"},
+        # Items deleted by update_capacity invalidate their prefixes too
+        {"fn": "update_capacity", "args": ["user1", "50"], "expected": "1"},
+        {"fn": "find_item", "args": ["/lab", "item"], "expected": ""},
+        {
+            "fn": "get_cache_stats",
+            "args": [],
+            "expected": "hits: 6, misses: 10, invalidations: 4",
+        },
+    ]
+
+    test_exec("Level 4", tests)
+
+
 if __name__ == "__main__":
     print("🔄 Running inventory management")
     parser = argparse.ArgumentParser(
-        description="A coding practice problem simulating an inventory management system, where it gets progressively more difficult through 3 levels."
+        description="A coding practice problem simulating an inventory management system, where it gets progressively more difficult through 4 levels."
     )
 
     parser.add_argument(
         "--level",
         type=int,
-        default=3,
+        default=4,
         help="The number of levels to run (optional - defaults to all)",
     )
     args = parser.parse_args()
 
-    test_suites = [test_level_1, test_level_2, test_level_3]
+    test_suites = [test_level_1, test_level_2, test_level_3, test_level_4]
 
-    for i in range(min(3, args.level)):
+    for i in range(min(4, args.level)):
         test_suites[i]()
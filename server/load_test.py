@@ -0,0 +1,127 @@
+"""
+A load test client for server/server.py.
+
+Each connection sends `--pipeline` requests per round trip and waits for all of their responses
+before sending the next round. Latency is measured per request, from when its round was sent
+to when its response arrived.
+
+To run, start the server and then: `python server/load_test.py --port 8765`.
+Strings in `--args` may use `{conn}` and `{i}`, which are filled in with the connection number
+and the request number.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+
+def fill(value, conn: int, i: int):
+    if isinstance(value, str):
+        return value.format(conn=conn, i=i)
+    if isinstance(value, list):
+        return [fill(v, conn, i) for v in value]
+    return value
+
+
+async def run_connection(
+    conn: int, args, template: dict, latencies: list, errors: list
+):
+    if args.unix:
+        reader, writer = await asyncio.open_unix_connection(args.unix)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+
+    sent = 0
+    while sent < args.requests:
+        count = min(args.pipeline, args.requests - sent)
+        lines = []
+        for i in range(sent, sent + count):
+            request = {
+                "id": i,
+                "system": template["system"],
+                "method": template["method"],
+                "args": fill(template["args"], conn, i),
+            }
+            lines.append(json.dumps(request).encode() + b"\n")
+
+        start = time.perf_counter()
+        writer.write(b"".join(lines))
+        await writer.drain()
+        for i in range(sent, sent + count):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            assert response["id"] == i, (
+                f"❌ Expected response {i}, got {response['id']}."
+            )
+            if "error" in response:
+                errors.append(response["error"])
+        sent += count
+
+    writer.close()
+    await writer.wait_closed()
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index]
+
+
+async def main(args):
+    template = {
+        "system": args.system,
+        "method": args.method,
+        "args": json.loads(args.args),
+    }
+    latencies = []
+    errors = []
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            run_connection(conn, args, template, latencies, errors)
+            for conn in range(args.connections)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"\nRequests:   {len(latencies):,} ({len(errors):,} errors)")
+    print(f"Throughput: {len(latencies) / elapsed:,.0f} req/s")
+    if latencies:
+        for pct in [50, 99, 99.9]:
+            print(f"{f'p{pct}:':<12}{percentile(latencies, pct) * 1000:.2f} ms")
+    if errors:
+        print(f"\nFirst error: {errors[0]}")
+    return latencies, errors
+
+
+if __name__ == "__main__":
+    print("🔄 Load testing server")
+    parser = argparse.ArgumentParser(
+        description="Sends pipelined requests to server/server.py and reports throughput and tail latency."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to connect to")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to connect to")
+    parser.add_argument(
+        "--unix", help="Connect to this Unix socket path instead of TCP"
+    )
+    parser.add_argument(
+        "--connections", type=int, default=8, help="Concurrent connections"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=20_000, help="Requests per connection"
+    )
+    parser.add_argument(
+        "--pipeline", type=int, default=64, help="Requests per round trip"
+    )
+    parser.add_argument("--system", default="chat", help="System to call")
+    parser.add_argument("--method", default="send_message", help="Method to call")
+    parser.add_argument(
+        "--args",
+        default='["user{conn}", "msg{i}", "load test"]',
+        help="JSON list of arguments",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
@@ -0,0 +1,154 @@
+"""
+An asyncio front end that serves ChatSystem, BankLedger, FoodDeliverySystem and InventorySystem over a socket.
+
+The protocol is newline-delimited JSON. Each request line looks like
+
+    {"id": 1, "system": "bank", "method": "deposit", "args": ["acct1", "USD", 100]}
+
+and gets exactly one response line, either {"id": 1, "result": ...} or {"id": 1, "error": "..."}.
+`system` is one of "bank", "chat", "food" or "inventory".
+
+Clients may pipeline as many requests as they like without waiting for responses.
+Every request that arrives during one event loop tick is run in a single pass, in arrival order,
+so commands to the same system always run in the order they were received.
+Responses on a connection come back in the same order as its requests.
+
+To run: `python server/server.py --port 8765` or `python server/server.py --unix /tmp/practice.sock`.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINE_LIMIT = 1 << 20
+
+
+def load_class(problem: str, module: str, name: str) -> type:
+    """
+    Loads a class from a problem directory by file path.
+    The problem directories all have a test.py, so they can't go on sys.path.
+    """
+    spec = importlib.util.spec_from_file_location(
+        module, os.path.join(ROOT, problem, f"{module}.py")
+    )
+    loaded = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(loaded)
+    return getattr(loaded, name)
+
+
+def default_systems() -> dict:
+    return {
+        "bank": load_class("bank_ledger", "bank_system", "BankLedger")(),
+        "chat": load_class("chat", "chat_system", "ChatSystem")(),
+        "food": load_class(
+            "food_delivery", "food_delivery_system", "FoodDeliverySystem"
+        )(),
+        "inventory": load_class(
+            "inventory_management", "inventory_system", "InventorySystem"
+        )(),
+    }
+
+
+class CommandServer:
+    def __init__(self, systems: dict):
+        self.systems = systems
+        self.pending = []
+        self.flush_scheduled = False
+        self.batches = 0
+        self.commands = 0
+        self.connections = 0
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self.connections += 1
+        try:
+            while True:
+                # readline doesn't yield while complete lines are buffered, so a
+                # pipelined burst is queued in full before flush runs.
+                line = await reader.readline()
+                if not line:
+                    break
+                self.pending.append((writer, line))
+                if not self.flush_scheduled:
+                    self.flush_scheduled = True
+                    asyncio.get_running_loop().call_soon(self.flush)
+                await writer.drain()
+        except (ConnectionError, ValueError):
+            # ValueError is a line over LINE_LIMIT; there's no way to resync.
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    def flush(self):
+        """Runs every queued request in arrival order and writes the responses."""
+        self.flush_scheduled = False
+        batch, self.pending = self.pending, []
+
+        responses = {}
+        for writer, line in batch:
+            responses.setdefault(writer, []).append(self.execute(line))
+
+        for writer, lines in responses.items():
+            if not writer.is_closing():
+                writer.write(b"".join(lines))
+
+        self.batches += 1
+        self.commands += len(batch)
+
+    def execute(self, line: bytes) -> bytes:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            system = self.systems[request["system"]]
+            method = request["method"]
+            if method.startswith("_"):
+                raise AttributeError(f"{method} is not a public method")
+            result = getattr(system, method)(*request.get("args", []))
+            # Serialize here too: results like tuple-keyed dicts can't be encoded.
+            return encode({"id": request_id, "result": result})
+        except Exception as e:
+            return encode({"id": request_id, "error": f"{type(e).__name__}: {e}"})
+
+
+def encode(response: dict) -> bytes:
+    return json.dumps(response, default=str).encode() + b"\n"
+
+
+async def start(server: CommandServer, host: str, port: int, unix: str = None):
+    if unix:
+        return await asyncio.start_unix_server(
+            server.handle_connection, path=unix, limit=LINE_LIMIT
+        )
+    return await asyncio.start_server(
+        server.handle_connection, host, port, limit=LINE_LIMIT
+    )
+
+
+async def main(host: str, port: int, unix: str = None):
+    server = CommandServer(default_systems())
+    listener = await start(server, host, port, unix)
+    where = unix or ", ".join(str(s.getsockname()) for s in listener.sockets)
+    print(f"🔄 Serving on {where}")
+    async with listener:
+        await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serves the practice problem classes over newline-delimited JSON."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to bind")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to bind")
+    parser.add_argument("--unix", help="Serve on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,204 @@
+"""
+This is a test harness for the asyncio front end in server/server.py.
+
+It runs the server against a small stand-in system, so it passes before any of the problems are implemented.
+
+To run: `python server/test.py`
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import load_test
+from server import CommandServer, start
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def append(self, value):
+        self.calls.append(value)
+        return len(self.calls)
+
+    def tuple_keys(self):
+        return {(1, 2): 3}
+
+    def circular(self):
+        loop = []
+        loop.append(loop)
+        return loop
+
+    def _secret(self):
+        return "hidden"
+
+
+async def send(reader, writer, requests: list[dict]) -> list[dict]:
+    writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in requests))
+    await writer.drain()
+    return [json.loads(await reader.readline()) for _ in requests]
+
+
+async def with_server(check):
+    recorder = Recorder()
+    server = CommandServer({"recorder": recorder})
+    listener = await start(server, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    async with listener:
+        await check(server, recorder, port)
+        while server.connections:
+            await asyncio.sleep(0.01)
+
+
+def test_pipelining():
+    print("\n-----------------")
+    print("\n Testing pipelining")
+
+    async def check(server, recorder, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        requests = [
+            {"id": i, "system": "recorder", "method": "append", "args": [i]}
+            for i in range(200)
+        ]
+        responses = await send(reader, writer, requests)
+        writer.close()
+
+        assert [r["id"] for r in responses] == list(range(200)), (
+            "❌ Responses came back out of order."
+        )
+        assert [r["result"] for r in responses] == list(range(1, 201)), (
+            f"❌ Unexpected results {[r.get('result') for r in responses][:5]}..."
+        )
+        assert recorder.calls == list(range(200)), "❌ Commands ran out of order."
+        print("✅ Passed: 200 pipelined commands in order")
+
+        assert server.batches < server.commands, (
+            f"❌ Expected batching, got {server.batches} batches for {server.commands} commands."
+        )
+        print(f"✅ Passed: {server.commands} commands in {server.batches} batches")
+
+    asyncio.run(with_server(check))
+    print("\n🥳 Pipelining passes")
+
+
+def test_ordering_across_connections():
+    print("\n-----------------")
+    print("\n Testing ordering across connections")
+
+    async def check(server, recorder, port):
+        a = await asyncio.open_connection("127.0.0.1", port)
+        b = await asyncio.open_connection("127.0.0.1", port)
+        a_requests = [
+            {"id": i, "system": "recorder", "method": "append", "args": [f"a{i}"]}
+            for i in range(100)
+        ]
+        b_requests = [
+            {"id": i, "system": "recorder", "method": "append", "args": [f"b{i}"]}
+            for i in range(100)
+        ]
+        await asyncio.gather(send(*a, a_requests), send(*b, b_requests))
+        a[1].close()
+        b[1].close()
+
+        for prefix in ["a", "b"]:
+            seen = [c for c in recorder.calls if c.startswith(prefix)]
+            assert seen == [f"{prefix}{i}" for i in range(100)], (
+                f"❌ Commands from connection {prefix} ran out of order."
+            )
+        print("✅ Passed: each connection's commands ran in order")
+
+    asyncio.run(with_server(check))
+    print("\n🥳 Ordering across connections passes")
+
+
+def test_errors():
+    print("\n-----------------")
+    print("\n Testing errors")
+
+    async def check(server, recorder, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        requests = [
+            {"id": 1, "system": "nope", "method": "append", "args": [1]},
+            {"id": 2, "system": "recorder", "method": "missing", "args": []},
+            {"id": 3, "system": "recorder", "method": "_secret", "args": []},
+            {"id": 4, "system": "recorder", "method": "append", "args": [1, 2]},
+            {"id": 5, "system": "recorder", "method": "append", "args": ["ok"]},
+            # Results that can't be serialized must not take down the rest of the batch
+            {"id": 6, "system": "recorder", "method": "tuple_keys", "args": []},
+            {"id": 7, "system": "recorder", "method": "circular", "args": []},
+            {"id": 8, "system": "recorder", "method": "append", "args": ["after"]},
+        ]
+        responses = await send(reader, writer, requests)
+
+        writer.write(b"not json\n")
+        await writer.drain()
+        responses.append(json.loads(await reader.readline()))
+        writer.close()
+
+        for response in responses[:4] + responses[5:7] + responses[8:]:
+            assert "error" in response, f"❌ Expected an error, got {response}."
+            print(f"✅ Passed: {response['error']}")
+        for response, expected in [
+            (responses[4], {"id": 5, "result": 1}),
+            (responses[7], {"id": 8, "result": 2}),
+        ]:
+            assert response == expected, (
+                f"❌ Expected a result after errors, got {response}."
+            )
+            print(f"✅ Passed: {response}")
+
+    asyncio.run(with_server(check))
+    print("\n🥳 Errors passes")
+
+
+def test_unix_socket_load_test():
+    print("\n-----------------")
+    print("\n Testing load_test.py over a Unix socket")
+
+    def load_args(path: str, requests: int) -> argparse.Namespace:
+        return argparse.Namespace(
+            unix=path,
+            connections=3,
+            requests=requests,
+            pipeline=16,
+            system="recorder",
+            method="append",
+            args='["{conn}-{i}"]',
+        )
+
+    async def check(path: str):
+        recorder = Recorder()
+        server = CommandServer({"recorder": recorder})
+        listener = await start(server, None, None, unix=path)
+        async with listener:
+            latencies, errors = await load_test.main(load_args(path, 50))
+            assert len(latencies) == 150 and not errors, (
+                f"❌ Expected 150 clean requests, got {len(latencies)} with errors {errors[:1]}."
+            )
+            for conn in range(3):
+                seen = [c for c in recorder.calls if c.startswith(f"{conn}-")]
+                assert seen == [f"{conn}-{i}" for i in range(50)], (
+                    f"❌ Commands from connection {conn} ran out of order."
+                )
+            print("✅ Passed: 150 requests over 3 Unix socket connections")
+
+            latencies, errors = await load_test.main(load_args(path, 0))
+            assert latencies == [] and errors == [], "❌ Expected no requests."
+            print("✅ Passed: --requests 0 reports without crashing")
+
+            while server.connections:
+                await asyncio.sleep(0.01)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(check(os.path.join(tmp, "server.sock")))
+    print("\n🥳 Unix socket load test passes")
+
+
+if __name__ == "__main__":
+    print("🔄 Running server")
+    test_pipelining()
+    test_ordering_across_connections()
+    test_errors()
+    test_unix_socket_load_test()